@@ -2,12 +2,45 @@
 Complex Python example with multiple constructs
 """
 import asyncio
+import dataclasses
+import functools
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union, Generic, TypeVar
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple, Union, Generic, TypeVar
 from datetime import datetime
 import logging
+import re
+import struct
+import sys
+import time
+import weakref
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None  # type: ignore[assignment]
+
+try:
+    import asyncpg
+except ImportError:  # pragma: no cover - optional driver
+    asyncpg = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None  # type: ignore[assignment]
 
 # Type variables
 T = TypeVar('T')
@@ -19,6 +52,13 @@ MAX_CONNECTIONS = 100
 DEFAULT_TIMEOUT = 30
 API_VERSION = "v1.0.0"
 
+# Parameterized statements, kept constant so the server can cache their plans
+INSERT_USER_SQL = "INSERT INTO users (username, email) VALUES ($1, $2)"
+SELECT_USER_SQL = "SELECT * FROM users WHERE id = $1"
+
+# Marker for cache misses, so falsy cached values are still returned
+_SENTINEL: Any = object()
+
 # Database module
 class DatabaseConnection(ABC):
     """Abstract base class for database connections"""
@@ -28,7 +68,7 @@ class DatabaseConnection(ABC):
         pass
     
     @abstractmethod
-    async def execute_query(self, query: str) -> Dict:
+    async def execute_query(self, query: str, params: Optional[Tuple] = None) -> Dict:
         pass
     
     @abstractmethod
@@ -54,11 +94,11 @@ class PostgresConnection(DatabaseConnection):
             self._is_connected = True
             return True
         except Exception as e:
-            logging.error(f"Failed to connect to PostgreSQL: {e}")
+            logging.error("Failed to connect to PostgreSQL: %s", e)
             return False
     
-    async def execute_query(self, query: str) -> Dict:
-        """Execute SQL query"""
+    async def execute_query(self, query: str, params: Optional[Tuple] = None) -> Dict:
+        """Execute SQL query with positional ($1, $2, ...) parameters"""
         if not self._is_connected:
             raise ConnectionError("Not connected to database")
         
@@ -79,14 +119,117 @@ class MySQLConnection(DatabaseConnection):
     async def connect(self) -> bool:
         return True
     
-    async def execute_query(self, query: str) -> Dict:
+    async def execute_query(self, query: str, params: Optional[Tuple] = None) -> Dict:
+        return {"rows": [], "affected": 0}
+    
+    async def close(self) -> None:
+        pass
+
+class NullConnection(DatabaseConnection):
+    """Connection stub that accepts every query and returns no rows"""
+    
+    async def connect(self) -> bool:
+        return True
+    
+    async def execute_query(self, query: str, params: Optional[Tuple] = None) -> Dict:
         return {"rows": [], "affected": 0}
     
     async def close(self) -> None:
         pass
 
+class PostgresPool(DatabaseConnection):
+    """Pooled PostgreSQL connections backed by asyncpg"""
+    
+    def __init__(self, dsn: str, min_size: int = 5, max_size: int = 20,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.pool = None
+    
+    async def connect(self) -> bool:
+        """Open the connection pool"""
+        try:
+            self.pool = await asyncpg.create_pool(
+                self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                command_timeout=self.timeout
+            )
+            return True
+        except Exception as e:
+            logging.error("Failed to create PostgreSQL pool: %s", e)
+            return False
+    
+    async def execute_query(self, query: str, params: Optional[Tuple] = None) -> Dict:
+        """Execute SQL query on a pooled connection, returning its rows"""
+        if self.pool is None:
+            raise ConnectionError("Connection pool is not open")
+        
+        # fetch goes through asyncpg's prepared statement cache
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *(params or ()))
+        return {"rows": [dict(row) for row in rows]}
+    
+    async def close(self) -> None:
+        """Close all pooled connections"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
 # Data models
-@dataclass
+if msgspec is not None:
+    class UserMsg(msgspec.Struct, array_like=True):
+        """Wire schema for User records, encoded as a positional array"""
+        id: int
+        username: str
+        email: str
+        created_at: str
+        is_active: bool
+        metadata: dict
+
+    _USER_ENCODER = msgspec.msgpack.Encoder()
+    _USER_DECODER = msgspec.msgpack.Decoder(UserMsg)
+
+# Single-pass email shape check: local@domain.tld
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Timestamp shared by calls within the same millisecond: (time, datetime, iso).
+# Replaced as a whole so readers never see fields from different refreshes.
+_EPOCH = datetime.fromtimestamp(0)
+_last_ts: Tuple[float, datetime, str] = (0.0, _EPOCH, _EPOCH.isoformat())
+
+def _now() -> datetime:
+    """Current local time, reused for calls within the same millisecond"""
+    global _last_ts
+    t = time.time()
+    last = _last_ts
+    if 0.0 <= t - last[0] < 1e-3:
+        return last[1]
+    dt = datetime.fromtimestamp(t)
+    _last_ts = (t, dt, dt.isoformat())
+    return dt
+
+def _isoformat(dt: datetime) -> str:
+    """ISO format of dt, reusing the string precomputed for the shared timestamp"""
+    last = _last_ts
+    return last[2] if dt is last[1] else dt.isoformat()
+
+def _intern(value: str) -> str:
+    """Interned copy of a plain str; anything else is returned unchanged"""
+    return sys.intern(value) if type(value) is str else value
+
+def _parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """Timestamp from an ISO string, or as-is if the driver already decoded it"""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+# Length prefix for framed records (4-byte big-endian)
+_FRAME_HEADER = struct.Struct('>I')
+
+@dataclass(slots=True, weakref_slot=True)
 class User:
     """User data model"""
     id: int
@@ -96,13 +239,16 @@ class User:
     is_active: bool = True
     metadata: Optional[Dict] = None
     
+    # Generated from the field list by _compile_row_getter
+    to_tuple: ClassVar[Callable[['User'], Tuple]]
+    
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
     
     def validate_email(self) -> bool:
         """Validate email format"""
-        return '@' in self.email and '.' in self.email
+        return _EMAIL_RE.fullmatch(self.email) is not None
     
     def to_dict(self) -> Dict:
         """Convert user to dictionary"""
@@ -110,7 +256,7 @@ class User:
             'id': self.id,
             'username': self.username,
             'email': self.email,
-            'created_at': self.created_at.isoformat(),
+            'created_at': _isoformat(self.created_at),
             'is_active': self.is_active,
             'metadata': self.metadata
         }
@@ -120,14 +266,59 @@ class User:
         """Create user from dictionary"""
         return cls(
             id=data['id'],
-            username=data['username'],
-            email=data['email'],
-            created_at=datetime.fromisoformat(data['created_at']),
+            username=_intern(data['username']),
+            email=_intern(data['email']),
+            created_at=_parse_timestamp(data['created_at']),
             is_active=data.get('is_active', True),
             metadata=data.get('metadata')
         )
+    
+    def to_bytes(self) -> bytes:
+        """Serialize user to a length-prefixed frame (msgpack if available, else JSON)"""
+        row = self.to_tuple()
+        if msgspec is not None:
+            payload = _USER_ENCODER.encode(row)
+        else:
+            payload = json.dumps(row).encode()
+        return _FRAME_HEADER.pack(len(payload)) + payload
+    
+    @classmethod
+    def from_bytes(cls, frame: bytes) -> 'User':
+        """Create user from a frame produced by to_bytes"""
+        (size,) = _FRAME_HEADER.unpack_from(frame)
+        payload = frame[_FRAME_HEADER.size:_FRAME_HEADER.size + size]
+        if msgspec is not None:
+            row = msgspec.structs.astuple(_USER_DECODER.decode(payload))
+        else:
+            row = json.loads(payload)
+        
+        user_id, username, email, created_at, is_active, metadata = row
+        return cls(user_id, _intern(username), _intern(email),
+                   _parse_timestamp(created_at), is_active, metadata)
+
+def _compile_row_getter(cls: type) -> Callable[[Any], Tuple]:
+    """Generate a tuple-returning row getter from a dataclass schema"""
+    exprs = []
+    for field in dataclasses.fields(cls):
+        expr = f"self.{field.name}"
+        if field.type is datetime:
+            expr = f"_isoformat({expr})"
+        exprs.append(expr)
+    
+    source = f"def to_tuple(self):\n    return ({', '.join(exprs)},)\n"
+    namespace: Dict = {'_isoformat': _isoformat}
+    exec(source, namespace)
+    to_tuple = namespace['to_tuple']
+    to_tuple.__doc__ = f"Convert {cls.__name__.lower()} to a tuple row in field order"
+    return to_tuple
 
-@dataclass
+# Built once from the schema; skips the per-call dict of to_dict
+User.to_tuple = _compile_row_getter(User)
+
+# Attribute names update_user may assign
+_USER_FIELDS = frozenset(field.name for field in dataclasses.fields(User))
+
+@dataclass(slots=True)
 class Product:
     """Product data model"""
     id: int
@@ -135,7 +326,7 @@ class Product:
     price: float
     category: str
     description: Optional[str] = None
-    tags: List[str] = None
+    tags: Optional[List[str]] = None
     
     def __post_init__(self):
         if self.tags is None:
@@ -149,111 +340,261 @@ class ProductCategory:
     HOME = "home"
     SPORTS = "sports"
 
-# Generic cache class
-class Cache(Generic[K, V]):
-    """Generic cache implementation"""
+# Generic cache classes
+class Cache(ABC, Generic[K, V]):
+    """Abstract bounded cache; subclasses choose the eviction policy"""
+    
+    __slots__ = ("max_size",)
     
     def __init__(self, max_size: int = 1000):
+        if max_size < 1:
+            raise ValueError(f"Cache max_size must be at least 1, got {max_size}")
         self.max_size = max_size
-        self._data: Dict[K, V] = {}
-        self._access_order: List[K] = []
     
+    @abstractmethod
     def get(self, key: K) -> Optional[V]:
         """Get value from cache"""
-        if key in self._data:
-            self._access_order.remove(key)
-            self._access_order.append(key)
-            return self._data[key]
-        return None
+        pass
     
+    @abstractmethod
     def put(self, key: K, value: V) -> None:
         """Put value in cache"""
-        if len(self._data) >= self.max_size and key not in self._data:
-            # Remove least recently used
-            oldest_key = self._access_order.pop(0)
-            del self._data[oldest_key]
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Clear cache"""
+        pass
+
+class LRUCache(Cache[K, V]):
+    """Cache evicting the least recently used entry"""
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, max_size: int = 1000):
+        super().__init__(max_size)
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+    
+    def get(self, key: K) -> Optional[V]:
+        """Get value from cache"""
+        value = self._data.get(key, _SENTINEL)
+        if value is _SENTINEL:
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def put(self, key: K, value: V) -> None:
+        """Put value in cache"""
+        if key in self._data:
+            self._data.move_to_end(key)
+            self._data[key] = value
+            return
         
         self._data[key] = value
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+        if len(self._data) > self.max_size:
+            # Remove least recently used
+            self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Clear cache"""
+        self._data.clear()
+
+class FIFOCache(Cache[K, V]):
+    """Cache evicting the oldest inserted entry, with no bookkeeping on hits"""
+    
+    __slots__ = ("_data",)
+    
+    def __init__(self, max_size: int = 1000):
+        super().__init__(max_size)
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+    
+    def get(self, key: K) -> Optional[V]:
+        """Get value from cache"""
+        return self._data.get(key)
+    
+    def put(self, key: K, value: V) -> None:
+        """Put value in cache"""
+        data = self._data
+        data[key] = value
+        if len(data) > self.max_size:
+            # Remove oldest inserted
+            data.popitem(last=False)
     
     def clear(self) -> None:
         """Clear cache"""
         self._data.clear()
-        self._access_order.clear()
+
+class ClockCache(Cache[K, V]):
+    """Cache approximating LRU with one referenced bit per entry (CLOCK)"""
+    
+    __slots__ = ("_slots", "_index", "_hand")
+    
+    def __init__(self, max_size: int = 1000):
+        super().__init__(max_size)
+        # Each slot is [key, value, ref_bit]; _index maps key -> slot
+        self._slots: List[List[Any]] = []
+        self._index: Dict[K, int] = {}
+        self._hand = 0
+    
+    def get(self, key: K) -> Optional[V]:
+        """Get value from cache"""
+        idx = self._index.get(key)
+        if idx is None:
+            return None
+        slot = self._slots[idx]
+        slot[2] = 1
+        return slot[1]
+    
+    def put(self, key: K, value: V) -> None:
+        """Put value in cache"""
+        idx = self._index.get(key)
+        if idx is not None:
+            slot = self._slots[idx]
+            slot[1] = value
+            slot[2] = 1
+            return
+        
+        if len(self._slots) < self.max_size:
+            self._index[key] = len(self._slots)
+            self._slots.append([key, value, 0])
+            return
+        
+        # Sweep the hand, giving referenced entries a second chance
+        slots = self._slots
+        hand = self._hand
+        while slots[hand][2]:
+            slots[hand][2] = 0
+            hand = (hand + 1) % len(slots)
+        
+        del self._index[slots[hand][0]]
+        slots[hand] = [key, value, 0]
+        self._index[key] = hand
+        self._hand = (hand + 1) % len(slots)
+    
+    def clear(self) -> None:
+        """Clear cache"""
+        self._slots.clear()
+        self._index.clear()
+        self._hand = 0
+
+class WeakCache(LRUCache[K, V]):
+    """LRU cache whose evicted values stay findable while still referenced"""
+    
+    __slots__ = ("_weak",)
+    
+    def __init__(self, max_size: int = 1000):
+        super().__init__(max_size)
+        self._weak: "weakref.WeakValueDictionary[K, V]" = weakref.WeakValueDictionary()
+    
+    def get(self, key: K) -> Optional[V]:
+        """Get value from cache, reviving weakly held entries"""
+        value = super().get(key)
+        if value is None:
+            value = self._weak.get(key)
+            if value is not None:
+                super().put(key, value)
+        return value
+    
+    def put(self, key: K, value: V) -> None:
+        """Put value in cache"""
+        # Weak index first: it rejects values that can't be weakly referenced
+        self._weak[key] = value
+        super().put(key, value)
+    
+    def clear(self) -> None:
+        """Clear cache"""
+        super().clear()
+        self._weak.clear()
 
 # Service classes with decorators
-def retry(max_attempts: int = 3):
-    """Retry decorator"""
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            for attempt in range(max_attempts):
+# Logger for calls traced by observed
+_call_log = logging.getLogger(f"{__name__}.calls")
+
+def observed(max_attempts: int = 1) -> Callable[[Callable[..., Awaitable[T]]],
+                                               Callable[..., Awaitable[T]]]:
+    """Logging and retry decorator using a single coroutine wrapper"""
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+    
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        name = func.__name__
+        
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            log = _call_log.isEnabledFor(logging.INFO)
+            if log:
+                _call_log.info("Executing %s", name)
+                start = time.monotonic()
+            
+            if max_attempts == 1:
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
                 except Exception as e:
-                    if attempt == max_attempts - 1:
-                        raise e
-                    await asyncio.sleep(0.1 * (2 ** attempt))
-            return None
+                    _call_log.error("Error in %s: %s", name, e)
+                    raise
+            else:
+                for attempt in range(max_attempts):
+                    try:
+                        result = await func(*args, **kwargs)
+                        break
+                    except Exception as e:
+                        if attempt == max_attempts - 1:
+                            _call_log.error("Error in %s: %s", name, e)
+                            raise
+                        _call_log.warning("Attempt %d/%d of %s failed: %s",
+                                          attempt + 1, max_attempts, name, e)
+                        await asyncio.sleep(0.1 * (2 ** attempt))
+            
+            if log:
+                _call_log.info("Successfully executed %s in %.2fms",
+                               name, (time.monotonic() - start) * 1000)
+            return result
         return wrapper
     return decorator
 
-def log_execution(func):
-    """Logging decorator"""
-    async def wrapper(*args, **kwargs):
-        logging.info(f"Executing {func.__name__}")
-        try:
-            result = await func(*args, **kwargs)
-            logging.info(f"Successfully executed {func.__name__}")
-            return result
-        except Exception as e:
-            logging.error(f"Error in {func.__name__}: {e}")
-            raise
-    return wrapper
-
 class UserService:
     """User service with database operations"""
     
+    __slots__ = ("db", "cache", "logger")
+    
     def __init__(self, db: DatabaseConnection):
         self.db = db
-        self.cache: Cache[int, User] = Cache(max_size=500)
+        self.cache: Cache[int, User] = WeakCache(max_size=500)
         self.logger = logging.getLogger(__name__)
     
-    @retry(max_attempts=3)
-    @log_execution
+    @observed(max_attempts=3)
     async def create_user(self, username: str, email: str) -> User:
         """Create new user"""
         user = User(
             id=0,  # Would be generated by database
-            username=username,
-            email=email,
-            created_at=datetime.now()
+            username=_intern(username),
+            email=_intern(email),
+            created_at=_now()
         )
         
         if not user.validate_email():
             raise ValueError("Invalid email format")
         
         # Save to database
-        query = f"INSERT INTO users (username, email) VALUES ('{username}', '{email}')"
-        result = await self.db.execute_query(query)
+        result = await self.db.execute_query(INSERT_USER_SQL, (username, email))
         
         # Cache the user
         self.cache.put(user.id, user)
         
         return user
     
-    @log_execution
     async def get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        # Check cache first
+        # Cache hits return without entering the logged database path
         cached_user = self.cache.get(user_id)
-        if cached_user:
+        if cached_user is not None:
             return cached_user
-        
-        # Query database
-        query = f"SELECT * FROM users WHERE id = {user_id}"
-        result = await self.db.execute_query(query)
+        return await self._get_db(user_id)
+    
+    @observed()
+    async def _get_db(self, user_id: int) -> Optional[User]:
+        """Load user from the database and cache it"""
+        result = await self.db.execute_query(SELECT_USER_SQL, (user_id,))
         
         if result['rows']:
             user_data = result['rows'][0]
@@ -263,15 +604,42 @@ class UserService:
         
         return None
     
+    @observed()
+    async def get_users(self, user_ids: List[int]) -> List[Optional[User]]:
+        """Get several users, fetching all cache misses concurrently"""
+        found: Dict[int, Optional[User]] = {}
+        misses: List[int] = []
+        for user_id in user_ids:
+            cached_user = self.cache.get(user_id)
+            if cached_user is not None:
+                found[user_id] = cached_user
+            elif user_id not in found:
+                found[user_id] = None
+                misses.append(user_id)
+        
+        # Issue every miss at once so the round-trips overlap
+        results = await asyncio.gather(
+            *(self.db.execute_query(SELECT_USER_SQL, (user_id,)) for user_id in misses)
+        )
+        for user_id, result in zip(misses, results):
+            if result['rows']:
+                user = User.from_dict(result['rows'][0])
+                self.cache.put(user_id, user)
+                found[user_id] = user
+        
+        return [found[user_id] for user_id in user_ids]
+    
     async def update_user(self, user_id: int, **kwargs) -> bool:
         """Update user information"""
-        user = await self.get_user(user_id)
+        user = self.cache.get(user_id)
+        if user is None:
+            user = await self._get_db(user_id)
         if not user:
             return False
         
         # Update user attributes
         for key, value in kwargs.items():
-            if hasattr(user, key):
+            if key in _USER_FIELDS:
                 setattr(user, key, value)
         
         # Save to database
@@ -282,11 +650,18 @@ class UserService:
         return True
 
 class ProductService:
-    """Product service"""
+    """Product service with column-wise search fields"""
+    
+    __slots__ = ("db", "cache", "_products", "_names", "_categories", "_columns")
     
     def __init__(self, db: DatabaseConnection):
         self.db = db
-        self.cache: Cache[int, Product] = Cache()
+        self.cache: Cache[int, Product] = FIFOCache()
+        self._products: List[Product] = []
+        self._names: List[str] = []
+        self._categories: List[str] = []
+        # numpy views of the columns, rebuilt lazily after inserts
+        self._columns: Optional[Tuple[Any, Any]] = None
     
     async def create_product(self, name: str, price: float, category: str) -> Product:
         """Create new product"""
@@ -298,12 +673,32 @@ class ProductService:
         )
         
         # Save to database
+        self._products.append(product)
+        self._names.append(name.casefold())
+        self._categories.append(category)
+        self._columns = None
         return product
     
     async def search_products(self, query: str, category: Optional[str] = None) -> List[Product]:
-        """Search products"""
-        # Implementation would query database
-        return []
+        """Search products by name substring and optional category"""
+        query = query.casefold()
+        if np is None:
+            return [
+                product
+                for product, name, cat in zip(self._products, self._names, self._categories)
+                if (category is None or cat == category) and query in name
+            ]
+        
+        if not self._products:
+            return []
+        if self._columns is None:
+            self._columns = (np.array(self._names), np.array(self._categories))
+        names, categories = self._columns
+        
+        mask = np.char.find(names, query) >= 0
+        if category is not None:
+            mask &= categories == category
+        return [self._products[i] for i in np.flatnonzero(mask)]
 
 # Application configuration
 class AppConfig:
@@ -319,8 +714,9 @@ class AppConfig:
     @classmethod
     def from_file(cls, config_file: str) -> 'AppConfig':
         """Load configuration from file"""
-        with open(config_file, 'r') as f:
-            data = json.load(f)
+        with open(config_file, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         config = cls()
         for key, value in data.items():
@@ -350,9 +746,17 @@ def setup_logging(level: str = "INFO") -> None:
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+def validate_emails(emails: List[str]) -> List[bool]:
+    """Validate a batch of email addresses in one pass"""
+    match = _EMAIL_RE.fullmatch
+    return [m is not None for m in map(match, emails)]
+
 async def initialize_database(config: AppConfig) -> DatabaseConnection:
-    """Initialize database connection"""
-    if config.database_url.startswith('postgresql'):
+    """Initialize database connection, pooled when asyncpg is available"""
+    db: DatabaseConnection
+    if config.database_url.startswith('postgresql') and asyncpg is not None:
+        db = PostgresPool(config.database_url)
+    elif config.database_url.startswith('postgresql'):
         db = PostgresConnection(
             host='localhost',
             port=5432,
@@ -366,11 +770,27 @@ async def initialize_database(config: AppConfig) -> DatabaseConnection:
     await db.connect()
     return db
 
+async def warm_up(iterations: int = 8) -> None:
+    """Run the user service code paths on a stub database, muting call logs"""
+    def drop(record: logging.LogRecord) -> bool:
+        return False
+    
+    service = UserService(NullConnection())
+    _call_log.addFilter(drop)
+    try:
+        for _ in range(iterations):
+            await service.get_user(-1)
+            user = await service.create_user("warmup", "warmup@example.com")
+            await service.get_user(user.id)
+    finally:
+        _call_log.removeFilter(drop)
+
 async def main():
     """Main application entry point"""
     # Setup
     setup_logging("DEBUG")
     config = AppConfig()
+    await warm_up()
     
     # Initialize services
     db = await initialize_database(config)
@@ -387,9 +807,11 @@ async def main():
         print(f"Retrieved user: {retrieved_user}")
         
     except Exception as e:
-        logging.error(f"Application error: {e}")
+        logging.error("Application error: %s", e)
     finally:
         await db.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())